@@ -0,0 +1,571 @@
+import bisect
+import json
+import os
+from datetime import datetime
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.lang import Builder
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.button import Button
+from kivy.uix.label import Label
+from kivy.properties import NumericProperty, StringProperty
+from kivy.uix.popup import Popup
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
+from kivy.uix.screenmanager import Screen, ScreenManager
+from kivy.uix.textinput import TextInput
+
+GAMES_FILE = "games.json"
+DATE_FORMAT = "%d/%m/%Y %H:%M"
+
+
+def _parse_date(s):
+    """Parse a DATE_FORMAT string ("dd/mm/YYYY HH:MM") into a datetime.
+
+    strptime re-interprets its format string on every call, which adds up
+    when loading a long history; direct slicing is several times faster.
+    """
+    try:
+        return datetime(int(s[6:10]), int(s[3:5]), int(s[0:2]),
+                        int(s[11:13]), int(s[14:16]))
+    except (ValueError, IndexError):
+        return datetime.strptime(s, DATE_FORMAT)
+
+
+class Game:
+    """A single card game: a name, a creation date and a player->score map."""
+
+    __slots__ = ("name", "players", "date", "date_dt", "_total")
+
+    def __init__(self, name, players=None, date=None):
+        self.name = name
+        self.players = players if players is not None else {}
+        if date is None:
+            now = datetime.now()
+            self.date = now.strftime(DATE_FORMAT)
+            self.date_dt = now
+        else:
+            self.date = date
+            self.date_dt = _parse_date(date)
+        self._total = sum(self.players.values())
+
+    def add_player(self, player_name):
+        if player_name not in self.players:
+            self.players[player_name] = 0
+
+    def remove_player(self, player_name):
+        if player_name in self.players:
+            self._total -= self.players[player_name]
+            del self.players[player_name]
+
+    def update_score(self, player_name, delta):
+        if player_name in self.players:
+            self.players[player_name] += delta
+            self._total += delta
+
+    def edit_player_name(self, old_name, new_name):
+        if old_name in self.players and new_name not in self.players:
+            self.players[new_name] = self.players.pop(old_name)
+
+    def get_total_score(self):
+        return self._total
+
+    def to_dict(self):
+        return {"name": self.name, "players": self.players, "date": self.date}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["name"], data.get("players", {}), data.get("date"))
+
+
+# orjson encodes/decodes a few times faster than the stdlib and emits
+# compact bytes by default; fall back to json when it is not installed.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+# ijson streams a legacy JSON array without materializing the whole
+# document; only needed for files predating the NDJSON format.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# games.json is NDJSON: a header line followed by one record per line.
+# A mutation appends a superseding record (latest-wins on load) and a
+# delete appends a tombstone, so routine saves are O(1) appends instead
+# of full-file rewrites. Superseded lines are reclaimed by compaction.
+#
+# The header's version gates format evolution: bump it when the record
+# layout changes and migrate older versions in load_games. A bare JSON
+# array (the pre-versioned format) is treated as version 0 and upgraded
+# on the next compaction.
+FORMAT_VERSION = 1
+FORMAT_HEADER = {"format": "ndjson", "version": FORMAT_VERSION}
+
+_stale_records = 0  # superseded + tombstone lines currently in the file
+
+# Skip re-parsing when the file on disk is the one we last read or wrote.
+_games_cache = {"stat": None, "games": []}
+
+
+def _file_stat():
+    st = os.stat(GAMES_FILE)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_games():
+    global _stale_records
+    _stale_records = 0
+    if not os.path.exists(GAMES_FILE):
+        return []
+    if _file_stat() == _games_cache["stat"]:
+        return _games_cache["games"]
+    with open(GAMES_FILE, "rb", buffering=65536) as f:
+        head = f.readline()
+        if head.lstrip()[:1] == b"[":
+            # Legacy single-array format; rewritten as NDJSON on the
+            # next compaction.
+            f.seek(0)
+            if ijson is not None:
+                games = [Game.from_dict(obj)
+                         for obj in ijson.items(f, "item")]
+            else:
+                games = [Game.from_dict(obj) for obj in _loads(f.read())]
+        else:
+            version = _loads(head).get("version", 1) if head.strip() else 1
+            if version > FORMAT_VERSION:
+                raise ValueError(
+                    f"games file is schema version {version}; this build "
+                    f"only understands up to {FORMAT_VERSION}")
+            # Version 1 is the only NDJSON layout so far; migrations for
+            # later versions slot in here once they exist.
+            # NDJSON streams naturally: decode one record per line so
+            # memory stays flat however large the history grows.
+            records = {}
+            seen = 0
+            for line in f:  # the header line is already consumed
+                if not line.strip():
+                    continue
+                seen += 1
+                data = _loads(line)
+                if data.get("deleted"):
+                    records.pop(data["name"], None)
+                else:
+                    records[data["name"]] = data
+            _stale_records = seen - len(records)
+            games = [Game.from_dict(data) for data in records.values()]
+    _games_cache["stat"] = _file_stat()
+    _games_cache["games"] = games
+    return games
+
+
+def save_games(games):
+    """Rewrite the whole file with only live records (compaction)."""
+    global _stale_records
+    lines = [_dumps(FORMAT_HEADER)]
+    lines.extend(_dumps(game.to_dict()) for game in games)
+    with open(GAMES_FILE, "wb", buffering=65536) as f:
+        f.write(b"\n".join(lines) + b"\n")
+    _stale_records = 0
+    _games_cache["stat"] = _file_stat()
+    _games_cache["games"] = games
+
+
+def _append_record(record):
+    if not os.path.exists(GAMES_FILE):
+        save_games([])
+    with open(GAMES_FILE, "ab", buffering=65536) as f:
+        f.write(_dumps(record) + b"\n")
+    _games_cache["stat"] = None  # file no longer matches the cached parse
+
+
+def append_game(game):
+    """Persist a brand-new game as a single line append."""
+    _append_record(game.to_dict())
+
+
+def update_game(game):
+    """Append a superseding record for an existing game."""
+    global _stale_records
+    _append_record(game.to_dict())
+    _stale_records += 1
+
+
+def delete_game_record(name):
+    global _stale_records
+    _append_record({"name": name, "deleted": True})
+    _stale_records += 2  # the tombstone plus the record it kills
+
+
+def maybe_compact(games):
+    if _stale_records > max(len(games), 16):
+        save_games(games)
+
+
+def _make_recycle_list(viewclass, row_height, spacing=5):
+    """Build a RecycleView that recycles a small pool of viewclass rows."""
+    view = RecycleView()
+    layout = RecycleBoxLayout(orientation="vertical",
+                              default_size=(None, row_height),
+                              default_size_hint=(1, None),
+                              size_hint_y=None, spacing=spacing)
+    layout.bind(minimum_height=layout.setter("height"))
+    view.add_widget(layout)
+    view.viewclass = viewclass
+    return view
+
+
+class GameRow(RecycleDataViewBehavior, Button):
+    """One previous-game entry; instances are recycled as the list scrolls."""
+
+    game_name = StringProperty("")
+
+    def on_press(self):
+        app = App.get_running_app()
+        game = app.games_by_name.get(self.game_name)
+        if game is not None:
+            app.root.get_screen("home").open_game(game)
+
+
+# Compiled once at import; recycled rows share the rule instead of each
+# instance building its widgets and handler closures in Python.
+Builder.load_string("""
+<PlayerRow>:
+    size_hint_y: None
+    height: 40
+    spacing: 5
+    Button:
+        text: root.player_name
+        on_press: root.dispatch_action("edit")
+    Button:
+        text: "-"
+        size_hint_x: None
+        width: 40
+        on_press: root.dispatch_action("dec")
+    Label:
+        text: str(root.score)
+        size_hint_x: None
+        width: 60
+    Button:
+        text: "+"
+        size_hint_x: None
+        width: 40
+        on_press: root.dispatch_action("inc")
+    Button:
+        text: "X"
+        size_hint_x: None
+        width: 40
+        on_press: root.dispatch_action("remove")
+""")
+
+
+class PlayerRow(RecycleDataViewBehavior, BoxLayout):
+    """One player banner; instances are recycled as the list scrolls."""
+
+    player_name = StringProperty("")
+    score = NumericProperty(0)
+
+    def dispatch_action(self, action):
+        """Route every button on the row through one handler."""
+        screen = App.get_running_app().root.get_screen("game")
+        if action == "inc":
+            screen.update_score(self.player_name, 1)
+        elif action == "dec":
+            screen.update_score(self.player_name, -1)
+        elif action == "edit":
+            screen.edit_player_name(self.player_name)
+        elif action == "remove":
+            screen.remove_player(self.player_name)
+
+
+class HomeScreen(Screen):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        root = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        root.add_widget(Label(text="Game Counter", font_size=32,
+                              size_hint_y=None, height=60))
+        self.new_game_input = TextInput(hint_text="New game name",
+                                        multiline=False,
+                                        size_hint_y=None, height=40)
+        root.add_widget(self.new_game_input)
+        new_game_button = Button(text="Start New Game",
+                                 size_hint_y=None, height=50)
+        new_game_button.bind(on_press=self.start_new_game)
+        root.add_widget(new_game_button)
+        self.previous_games_list = _make_recycle_list(GameRow, 45)
+        root.add_widget(self.previous_games_list)
+        self.add_widget(root)
+
+    def on_pre_enter(self):
+        self.load_previous_games()
+
+    def load_previous_games(self):
+        # app.games is kept sorted oldest-first; show newest first.
+        self.previous_games_list.data = [
+            {"text": f"{game.name}  ({game.date})", "game_name": game.name}
+            for game in reversed(App.get_running_app().games)
+        ]
+
+    def start_new_game(self, instance):
+        name = self.new_game_input.text.strip()
+        if not name:
+            return
+        app = App.get_running_app()
+        if name in app.games_by_name:
+            return
+        game = Game(name)
+        bisect.insort(app.games, game, key=lambda g: g.date_dt)
+        app.games_by_name[game.name] = game
+        app.mark_dirty(game, new=True)
+        self.new_game_input.text = ""
+        self.open_game(game)
+
+    def open_game(self, game):
+        game_screen = self.manager.get_screen("game")
+        game_screen.load_game(game)
+        self.manager.current = "game"
+
+
+class GameScreen(Screen):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.current_game = None
+        self._last_press = {}
+        self._player_row_index = {}
+        # Popups are built lazily on first open and reused afterwards.
+        self._edit_player_popup = None
+        self._edit_player_target = None
+        self._edit_game_popup = None
+        self._delete_popup = None
+        root = BoxLayout(orientation="vertical", padding=10, spacing=10)
+
+        header = BoxLayout(size_hint_y=None, height=50, spacing=5)
+        back_button = Button(text="Back", size_hint_x=None, width=80)
+        back_button.bind(on_press=self.go_back)
+        header.add_widget(back_button)
+        self.game_name_label = Label(font_size=24)
+        header.add_widget(self.game_name_label)
+        edit_button = Button(text="Edit", size_hint_x=None, width=80)
+        edit_button.bind(on_press=self.edit_game_name)
+        header.add_widget(edit_button)
+        delete_button = Button(text="Delete", size_hint_x=None, width=80)
+        delete_button.bind(on_press=self.confirm_delete_game)
+        header.add_widget(delete_button)
+        root.add_widget(header)
+
+        self.total_score_label = Label(font_size=20,
+                                       size_hint_y=None, height=40)
+        root.add_widget(self.total_score_label)
+
+        add_row = BoxLayout(size_hint_y=None, height=40, spacing=5)
+        self.new_player_input = TextInput(hint_text="Player name",
+                                          multiline=False)
+        add_row.add_widget(self.new_player_input)
+        add_player_button = Button(text="Add Player",
+                                   size_hint_x=None, width=120)
+        add_player_button.bind(on_press=self.add_player)
+        add_row.add_widget(add_player_button)
+        root.add_widget(add_row)
+
+        self.player_list = _make_recycle_list(PlayerRow, 40)
+        root.add_widget(self.player_list)
+        self.add_widget(root)
+
+    def _debounced(self, key, interval=0.1):
+        """Return True if an event for key should be accepted.
+
+        on_press can fire more than once per physical click on some input
+        backends; drop repeats that arrive within interval seconds.
+        """
+        now = Clock.get_time()
+        if now - self._last_press.get(key, -interval) < interval:
+            return False
+        self._last_press[key] = now
+        return True
+
+    def load_game(self, game):
+        self.current_game = game
+        self.game_name_label.text = game.name
+        self.player_list.data = [
+            {"player_name": name, "score": score}
+            for name, score in game.players.items()
+        ]
+        self._player_row_index = {
+            name: index for index, name in enumerate(game.players)
+        }
+        self.total_score_label.text = f"Total: {game.get_total_score()}"
+
+    def add_player(self, instance):
+        if not self._debounced(("add_player",)):
+            return
+        player_name = self.new_player_input.text.strip()
+        if not player_name or player_name in self.current_game.players:
+            return
+        self.current_game.add_player(player_name)
+        self.new_player_input.text = ""
+        self.load_game(self.current_game)
+
+    def remove_player(self, player_name):
+        self.current_game.remove_player(player_name)
+        self.load_game(self.current_game)
+
+    def update_score(self, player_name, delta):
+        if not self._debounced(("update_score", player_name)):
+            return
+        self.current_game.update_score(player_name, delta)
+        # Only one row and the total change on a score tap; full load_game
+        # is reserved for player set changes.
+        row = self.player_list.data[self._player_row_index[player_name]]
+        row["score"] = self.current_game.players[player_name]
+        self.player_list.refresh_from_data()
+        self.total_score_label.text = \
+            f"Total: {self.current_game.get_total_score()}"
+
+    def _name_popup(self, title, on_save):
+        """Build a reusable one-input popup; returns (popup, input)."""
+        content = BoxLayout(orientation="vertical", padding=10, spacing=10)
+        name_input = TextInput(multiline=False, size_hint_y=None, height=40)
+        content.add_widget(name_input)
+        save_button = Button(text="Save", size_hint_y=None, height=40)
+        save_button.bind(on_press=on_save)
+        content.add_widget(save_button)
+        popup = Popup(title=title, content=content, size_hint=(0.8, 0.4))
+        return popup, name_input
+
+    def edit_player_name(self, player_name):
+        if self._edit_player_popup is None:
+            self._edit_player_popup, self._edit_player_input = \
+                self._name_popup("Edit player name", self._save_player_name)
+        self._edit_player_target = player_name
+        self._edit_player_input.text = player_name
+        self._edit_player_popup.open()
+
+    def _save_player_name(self, instance):
+        new_name = self._edit_player_input.text.strip()
+        old_name = self._edit_player_target
+        if new_name and new_name != old_name:
+            self.current_game.edit_player_name(old_name, new_name)
+            self.load_game(self.current_game)
+        self._edit_player_popup.dismiss()
+
+    def edit_game_name(self, instance):
+        if self._edit_game_popup is None:
+            self._edit_game_popup, self._edit_game_input = \
+                self._name_popup("Edit game name", self._save_game_name)
+        self._edit_game_input.text = self.current_game.name
+        self._edit_game_popup.open()
+
+    def _save_game_name(self, instance):
+        new_name = self._edit_game_input.text.strip()
+        app = App.get_running_app()
+        if new_name and new_name not in app.games_by_name:
+            old_name = self.current_game.name
+            self.current_game.name = new_name
+            app.games_by_name[new_name] = app.games_by_name.pop(old_name)
+            # On disk a rename is a tombstone for the old name plus a
+            # fresh record under the new one.
+            app.mark_deleted(old_name)
+            app.mark_dirty(self.current_game, new=True)
+            self.game_name_label.text = new_name
+        self._edit_game_popup.dismiss()
+
+    def confirm_delete_game(self, instance):
+        if self._delete_popup is None:
+            content = BoxLayout(orientation="vertical", padding=10,
+                                spacing=10)
+            self._delete_label = Label()
+            content.add_widget(self._delete_label)
+            buttons = BoxLayout(size_hint_y=None, height=40, spacing=10)
+            yes_button = Button(text="Delete")
+            yes_button.bind(on_press=self._delete_current_game)
+            buttons.add_widget(yes_button)
+            no_button = Button(text="Cancel")
+            buttons.add_widget(no_button)
+            content.add_widget(buttons)
+            self._delete_popup = Popup(title="Delete game", content=content,
+                                       size_hint=(0.8, 0.4))
+            no_button.bind(on_press=self._delete_popup.dismiss)
+        self._delete_label.text = f"Delete '{self.current_game.name}'?"
+        self._delete_popup.open()
+
+    def _delete_current_game(self, instance):
+        app = App.get_running_app()
+        app.games.remove(self.current_game)
+        del app.games_by_name[self.current_game.name]
+        app.mark_deleted(self.current_game.name, self.current_game)
+        self._delete_popup.dismiss()
+        self.manager.current = "home"
+
+    def go_back(self, instance):
+        app = App.get_running_app()
+        # current_game is the same object stored in app.games, so scores are
+        # already up to date; just make sure it is still tracked, then persist.
+        if self.current_game.name not in app.games_by_name:
+            bisect.insort(app.games, self.current_game,
+                          key=lambda g: g.date_dt)
+            app.games_by_name[self.current_game.name] = self.current_game
+        app.mark_dirty(self.current_game)
+        self.manager.current = "home"
+
+
+class CardGameApp(App):
+    def build(self):
+        self.games = load_games()
+        self.games.sort(key=lambda g: g.date_dt)
+        self.games_by_name = {game.name: game for game in self.games}
+        self._dirty = False
+        self._pending = {}  # Game -> True if not yet on disk
+        self._pending_deletes = []
+        manager = ScreenManager()
+        manager.add_widget(HomeScreen(name="home"))
+        manager.add_widget(GameScreen(name="game"))
+        return manager
+
+    def mark_dirty(self, game, new=False):
+        """Request a save for game; bursts coalesce into one flush."""
+        self._pending.setdefault(game, new)
+        self._schedule_flush()
+
+    def mark_deleted(self, name, game=None):
+        if game is not None:
+            self._pending.pop(game, None)
+        self._pending_deletes.append(name)
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        if not self._dirty:
+            self._dirty = True
+            Clock.schedule_once(self._flush, 0.5)
+
+    def _flush(self, *args):
+        if not self._dirty:
+            return
+        for name in self._pending_deletes:
+            delete_game_record(name)
+        for game, is_new in self._pending.items():
+            if is_new:
+                append_game(game)
+            else:
+                update_game(game)
+        self._pending.clear()
+        self._pending_deletes.clear()
+        self._dirty = False
+        maybe_compact(self.games)
+
+    def on_stop(self):
+        self._flush()
+
+
+if __name__ == "__main__":
+    CardGameApp().run()